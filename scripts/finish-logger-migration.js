@@ -13,15 +13,41 @@ const files = [
   { path: 'src/lib/payment-webhook-handler.ts', component: 'paymentWebhookHandler' },
 ];
 
+// Logger call used for each console level; console.error is handled separately via logError
+const LOG_METHODS = {
+  log: 'log.info',
+  warn: 'log.warn',
+};
+
+// Compiled once at load time and reused for every file.
+// console.log(...) / console.warn(...) or console.error(error, ...), matched in a single scan.
+// Arguments are matched lazily up to a `)` followed by `;`, `}`, `//` or end of line, and
+// nothing crosses a newline, so one match never swallows a later call or an unrelated line.
+const CALL_END = String.raw`\)(?=[ \t]*(?:;|\}|\/\/|$))(?:[ \t]*;)?`;
+const CONSOLE_CALL_RE = new RegExp(
+  String.raw`console\.(log|warn)\((.*?)${CALL_END}` +
+    String.raw`|console\.error\(([^,)\n]+),[ \t]*(.*?)${CALL_END}`,
+  'gm'
+);
+const IMPORT_LINE_RE = /^import\s+[^\n]+;$/gm;
+
 function ensureLoggerImport(content) {
-  if (content.includes("from '@/lib/services/logger'")) {
+  // Match the closing quote so sibling modules (e.g. logger-types) don't count,
+  // and accept either quote style so double-quoted imports aren't duplicated
+  if (
+    content.includes("@/lib/services/logger'") ||
+    content.includes('@/lib/services/logger"')
+  ) {
     return content;
   }
 
   // Find last import and add after it
-  const lastImportMatch = content.match(/^import\s+[^\n]+;$/m);
+  let lastImportMatch = null;
+  for (const match of content.matchAll(IMPORT_LINE_RE)) {
+    lastImportMatch = match;
+  }
   if (lastImportMatch) {
-    const lastImportEnd = content.indexOf(lastImportMatch[0]) + lastImportMatch[0].length;
+    const lastImportEnd = lastImportMatch.index + lastImportMatch[0].length;
     return (
       content.substring(0, lastImportEnd) +
       "\nimport { log, logError } from '@/lib/services/logger';" +
@@ -33,39 +59,63 @@ function ensureLoggerImport(content) {
   return "import { log, logError } from '@/lib/services/logger';\n\n" + content;
 }
 
-function replaceConsoleInFile(filePath, component) {
+async function replaceConsoleInFile(filePath, component) {
   try {
-    let content = fs.readFileSync(filePath, 'utf8');
-    let modified = false;
+    const buffer = await fs.promises.readFile(filePath);
 
-    // Count original console statements
-    const originalCount = (content.match(/console\.(log|warn|error)/g) || []).length;
+    // Fast path: byte-level scan before decoding or any regex work
+    if (!buffer.includes('console.')) {
+      console.log(`⏭️  ${filePath}: No changes needed`);
+      return 0;
+    }
 
-    // Replace: console.log(...) with template literals
-    content = content.replace(/console\.log\((.*)\);?/g, (match, args) => {
-      modified = true;
-      // Keep the args as-is, they already have the formatted message
-      return `log.info({ msg: ${args}, component: "${component}" });`;
-    });
+    let content = buffer.toString('utf8');
 
-    // Replace: console.warn(...) with template literals
-    content = content.replace(/console\.warn\((.*)\);?/g, (match, args) => {
-      modified = true;
-      return `log.warn({ msg: ${args}, component: "${component}" });`;
-    });
+    // One match is exactly one single-line console call, so counting matches as they are
+    // replaced equals the number of console statements removed, without before/after rescans
+    let replaced = 0;
 
-    // Replace: console.error(error, ...)
-    content = content.replace(/console\.error\(([^,]+),\s*(.*)\);?/g, (match, errorVar, rest) => {
-      modified = true;
-      return `logError(${errorVar}, "", { component: "${component}" });`;
+    content = content.replace(CONSOLE_CALL_RE, (match, level, args, errorVar) => {
+      replaced++;
+      if (errorVar !== undefined) {
+        return `logError(${errorVar}, "", { component: "${component}" });`;
+      }
+      // Keep the args as-is, they already have the formatted message
+      return `${LOG_METHODS[level]}({ msg: ${args}, component: "${component}" });`;
     });
 
-    if (modified) {
+    if (replaced > 0) {
       content = ensureLoggerImport(content);
-      fs.writeFileSync(filePath, content, 'utf8');
-      const finalCount = (content.match(/console\.(log|warn|error)/g) || []).length;
-      const replaced = originalCount - finalCount;
-      console.log(`✅ ${filePath}: Replaced ${replaced}/${originalCount} statements`);
+      // Write to a sibling temp file and rename so the target is never left half-written
+      const tmpPath = `${filePath}.tmp`;
+      // Only stat when a write is actually needed; the rename would otherwise drop the mode bits
+      const { mode } = await fs.promises.stat(filePath);
+      let handle;
+      try {
+        // 'wx' fails instead of clobbering a pre-existing temp file that isn't ours
+        handle = await fs.promises.open(tmpPath, 'wx');
+      } catch (error) {
+        if (error.code === 'EEXIST') {
+          throw new Error(
+            `${tmpPath} already exists (left by an interrupted run?); remove it and retry`
+          );
+        }
+        throw error;
+      }
+      try {
+        try {
+          await handle.chmod(mode & 0o7777);
+          await handle.writeFile(content, 'utf8');
+        } finally {
+          await handle.close();
+        }
+        await fs.promises.rename(tmpPath, filePath);
+      } catch (error) {
+        // Don't leave a stray temp file next to the source on failure
+        await fs.promises.rm(tmpPath, { force: true });
+        throw error;
+      }
+      console.log(`✅ ${filePath}: Replaced ${replaced} statements`);
       return replaced;
     }
 
@@ -77,12 +127,20 @@ function replaceConsoleInFile(filePath, component) {
   }
 }
 
-console.log('🔄 Finishing logger migration for 3 remaining files...\n');
+async function main() {
+  console.log('🔄 Finishing logger migration for 3 remaining files...\n');
+
+  // Files are independent, so read/transform/write them concurrently
+  const counts = await Promise.all(
+    files.map(({ path, component }) => replaceConsoleInFile(path, component))
+  );
+
+  let totalReplaced = 0;
+  for (const count of counts) {
+    if (count > 0) totalReplaced += count;
+  }
 
-let totalReplaced = 0;
-for (const { path, component } of files) {
-  const count = replaceConsoleInFile(path, component);
-  if (count > 0) totalReplaced += count;
+  console.log(`\n✨ Done! Replaced ${totalReplaced} total console statements`);
 }
 
-console.log(`\n✨ Done! Replaced ${totalReplaced} total console statements`);
+main();
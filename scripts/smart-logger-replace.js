@@ -28,10 +28,6 @@ function getComponentName(filePath) {
 
 function processFile(filePath) {
   try {
-    if (!fs.existsSync(filePath)) {
-      return { success: false, error: 'File not found' };
-    }
-
     let content = fs.readFileSync(filePath, 'utf8');
     const original = content;
     const component = getComponentName(filePath);
@@ -165,6 +161,10 @@ function processFile(filePath) {
 
     return { success: true, replacementCount: 0, modified: false };
   } catch (error) {
+    // Missing files surface here from readFileSync, saving a separate existsSync stat
+    if (error.code === 'ENOENT') {
+      return { success: false, error: 'File not found' };
+    }
     return { success: false, error: error.message };
   }
 }